@@ -16,12 +16,21 @@ Uso Recomendado:
     import numpyless as np  # ¡Cuidado con es
 
 Tipos de Datos:
-- Vector: list[float] - Un array 1D de flotantes
+- Vector: list[float] o array.array('d') - Un array 1D de flotantes
 - Matriz: list[list[float]] - Un array 2D de flotantes (filas x columnas)
+
+Las funciones aceptan vectores (y filas de matrices) como array.array('d'),
+que guarda los flotantes contiguos a 8 bytes cada uno en lugar de un objeto
+float por elemento. Los resultados siempre se devuelven como listas.
 """
 
+from array import array
+from math import hypot, prod
+from numbers import Number
+from operator import mul
+
 # --- Alias de Tipos Nativos ---
-Vector = list[float]
+Vector = list[float] | array
 Matriz = list[list[float]]
 
 # -------------------------------------------------------------------
@@ -30,15 +39,6 @@ Matriz = list[list[float]]
 
 
 def zeros(shape: tuple[int, int]) -> Matriz:
-    filas, columnas = shape
-    matriz = []
-    for fila in range(filas):
-        mini_matriz = []
-        for columna in range(columnas):
-            mini_matriz.append(0.0)
-        matriz.append(mini_matriz)
-    return matriz
-
     """Crea una matriz rellena de ceros.
 
     Equivalente en NumPy: np.zeros(shape)
@@ -55,18 +55,13 @@ def zeros(shape: tuple[int, int]) -> Matriz:
 
     Pista: Usa listas por comprensión anidadas
     """
+    filas, columnas = shape
+    # [valor] * columnas crea cada fila en C; una fila nueva por iteración
+    # evita que todas las filas sean la misma lista
+    return [[0.0] * columnas for _ in range(filas)]
 
 
 def ones(shape: tuple[int, int]) -> Matriz:
-    filas, columnas = shape
-    matriz = []
-    for fila in range(filas):
-        mini_matriz = []
-        for columna in range(columnas):
-            mini_matriz.append(1.0)
-        matriz.append(mini_matriz)
-    return matriz
-
     """Crea una matriz rellena de unos.
 
     Equivalente en NumPy: np.ones(shape)
@@ -83,6 +78,8 @@ def ones(shape: tuple[int, int]) -> Matriz:
 
     Pista: Similar a zeros() pero con 1.0
     """
+    filas, columnas = shape
+    return [[1.0] * columnas for _ in range(filas)]
 
 
 def identity(n: int) -> Matriz:
@@ -145,15 +142,6 @@ def shape(A: Matriz) -> tuple[int, int]:
 
 
 def transpose(A: Matriz) -> Matriz:
-    filas = len(A)
-    columnas = len(A[0])
-    transpuesta = [[0 for _ in range(filas)] for _ in range(columnas)]
-
-    for fila in range(filas):
-        for columna in range(columnas):
-            transpuesta[columna][fila] = A[fila][columna]
-
-    return transpuesta
     """Devuelve la transpuesta de una matriz A.
 
     La transpuesta intercambia filas por columnas: A_t[j][i] = A[i][j].
@@ -172,7 +160,16 @@ def transpose(A: Matriz) -> Matriz:
 
     Pista: Usa zip(*A) o listas por comprensión
     """
-    raise NotImplementedError("Función no implementada.")
+    return list(map(list, zip(*A)))
+
+
+def _transpose_view(A: Matriz) -> tuple[tuple[float, ...], ...]:
+    """Transpuesta de solo lectura: las columnas quedan como las tuplas de zip.
+
+    Para uso interno cuando el resultado no se modifica; evita copiar cada
+    columna a una lista nueva.
+    """
+    return tuple(zip(*A))
 
 
 # -------------------------------------------------------------------
@@ -203,7 +200,11 @@ def dot(v: Vector, w: Vector) -> float:
 
     Pista: Usa sum() y zip()
     """
-    raise NotImplementedError("Función no implementada.")
+    if len(v) != len(w):
+        raise ValueError(
+            f"Los vectores deben tener la misma dimensión: {len(v)} != {len(w)}"
+        )
+    return float(sum(map(mul, v, w)))
 
 
 def add(v: Vector, w: Vector) -> Vector:
@@ -227,7 +228,11 @@ def add(v: Vector, w: Vector) -> Vector:
 
     Pista: Usa listas por comprensión con zip()
     """
-    raise NotImplementedError("Función no implementada.")
+    if len(v) != len(w):
+        raise ValueError(
+            f"Los vectores deben tener la misma dimensión: {len(v)} != {len(w)}"
+        )
+    return [float(a + b) for a, b in zip(v, w)]
 
 
 def multiply(c: float, v: Vector) -> Vector:
@@ -248,7 +253,7 @@ def multiply(c: float, v: Vector) -> Vector:
 
     Pista: Multiplica c por cada elemento
     """
-    raise NotImplementedError("Función no implementada.")
+    return [float(c * x) for x in v]
 
 
 def norm(v: Vector) -> float:
@@ -270,7 +275,8 @@ def norm(v: Vector) -> float:
 
     Pista: Usa dot(v, v) y luego sqrt() del módulo math
     """
-    raise NotImplementedError("Función no implementada.")
+    # hypot calcula la norma L2 en C, sin desbordes con valores extremos
+    return hypot(*v)
 
 
 # -------------------------------------------------------------------
@@ -278,6 +284,23 @@ def norm(v: Vector) -> float:
 # -------------------------------------------------------------------
 
 
+def _describir_forma(A: Matriz) -> str:
+    """Describe la forma de A para mensajes de error, sin asumir que es regular."""
+    longitudes = [len(fila) for fila in A]
+    if len(set(longitudes)) <= 1:
+        return f"{len(A)}x{longitudes[0] if longitudes else 0}"
+    return f"{len(A)} filas de longitudes {longitudes}"
+
+
+def _validar_misma_forma(A: Matriz, B: Matriz) -> None:
+    """Lanza ValueError si A y B no tienen exactamente la misma forma."""
+    if len(A) != len(B) or any(len(fa) != len(fb) for fa, fb in zip(A, B)):
+        raise ValueError(
+            "Las matrices deben tener la misma forma: "
+            f"{_describir_forma(A)} y {_describir_forma(B)}"
+        )
+
+
 def add_matrices(A: Matriz, B: Matriz) -> Matriz:
     """Suma dos matrices elemento a elemento.
 
@@ -299,7 +322,10 @@ def add_matrices(A: Matriz, B: Matriz) -> Matriz:
 
     Pista: Suma elemento a elemento, fila por fila
     """
-    raise NotImplementedError("Función no implementada.")
+    _validar_misma_forma(A, B)
+    return [
+        [float(a + b) for a, b in zip(fila_a, fila_b)] for fila_a, fila_b in zip(A, B)
+    ]
 
 
 def multiply_matrix(c: float, A: Matriz) -> Matriz:
@@ -320,7 +346,130 @@ def multiply_matrix(c: float, A: Matriz) -> Matriz:
 
     Pista: Similar a multiply() pero para cada fila
     """
-    raise NotImplementedError("Función no implementada.")
+    return [[float(c * x) for x in fila] for fila in A]
+
+
+def axpy_matrix(c: float, A: Matriz, B: Matriz) -> Matriz:
+    """Calcula c*A + B en una sola pasada.
+
+    Equivale a add_matrices(multiply_matrix(c, A), B), pero sin construir
+    la matriz intermedia c*A: cada elemento se escala y se suma a la vez.
+
+    Equivalente en NumPy: c * A + B
+
+    Args:
+        c: El escalar que multiplica a A.
+        A: La matriz escalada.
+        B: La matriz que se suma.
+
+    Returns:
+        Matriz: La matriz resultante c*A + B.
+
+    Raises:
+        ValueError: Si las matrices no tienen la misma forma.
+
+    Ejemplo:
+        >>> axpy_matrix(2, [[1, 2], [3, 4]], [[10, 20], [30, 40]])
+        [[12.0, 24.0], [36.0, 48.0]]
+    """
+    _validar_misma_forma(A, B)
+    return [
+        [float(c * a + b) for a, b in zip(fila_a, fila_b)]
+        for fila_a, fila_b in zip(A, B)
+    ]
+
+
+# Tamaño a partir del cual matmul usa Strassen, y tamaño en el que la
+# recursión vuelve al algoritmo clásico (ahí dominan los costos constantes)
+_UMBRAL_STRASSEN = 128
+_CASO_BASE_STRASSEN = 64
+
+
+def _a_float(A: Matriz) -> Matriz:
+    """Copia A convirtiendo cada elemento a float."""
+    return [[float(x) for x in fila] for fila in A]
+
+
+def _matmul_clasico(A: Matriz, B: Matriz) -> Matriz:
+    """Producto clásico O(n³) sin validar dimensiones.
+
+    Asume que A y B ya contienen floats: quien llama convierte sus operandos
+    una sola vez al entrar, en lugar de pagar un float() por cada elemento
+    del resultado.
+    """
+    # Transponer B una sola vez para recorrer ambos operandos por filas
+    columnas_b = _transpose_view(B)
+    return [
+        [sum(map(mul, fila_a, columna_b)) for columna_b in columnas_b]
+        for fila_a in A
+    ]
+
+
+def _sumar(A: Matriz, B: Matriz) -> Matriz:
+    return [[a + b for a, b in zip(fila_a, fila_b)] for fila_a, fila_b in zip(A, B)]
+
+
+def _restar(A: Matriz, B: Matriz) -> Matriz:
+    return [[a - b for a, b in zip(fila_a, fila_b)] for fila_a, fila_b in zip(A, B)]
+
+
+def _strassen(A: Matriz, B: Matriz) -> Matriz:
+    """Producto de matrices cuadradas n×n con el algoritmo de Strassen.
+
+    Rellena con ceros hasta el menor tamaño m >= n que se pueda partir a
+    la mitad hasta el caso base, y recorta el resultado al final.
+    """
+    n = len(A)
+    niveles = 0
+    while -(-n // 2**niveles) > _CASO_BASE_STRASSEN:
+        niveles += 1
+    m = -(-n // 2**niveles) * 2**niveles
+
+    # Convertir a float una sola vez; la recursión ya no vuelve a convertir
+    relleno = [0.0] * (m - n)
+    A = [[float(x) for x in fila] + relleno for fila in A]
+    B = [[float(x) for x in fila] + relleno for fila in B]
+    if m != n:
+        A += [[0.0] * m for _ in range(m - n)]
+        B += [[0.0] * m for _ in range(m - n)]
+
+    C = _strassen_recursivo(A, B)
+    if m != n:
+        C = [fila[:n] for fila in C[:n]]
+    return C
+
+
+def _strassen_recursivo(A: Matriz, B: Matriz) -> Matriz:
+    n = len(A)
+    if n <= _CASO_BASE_STRASSEN:
+        return _matmul_clasico(A, B)
+
+    h = n // 2
+    A11 = [fila[:h] for fila in A[:h]]
+    A12 = [fila[h:] for fila in A[:h]]
+    A21 = [fila[:h] for fila in A[h:]]
+    A22 = [fila[h:] for fila in A[h:]]
+    B11 = [fila[:h] for fila in B[:h]]
+    B12 = [fila[h:] for fila in B[:h]]
+    B21 = [fila[:h] for fila in B[h:]]
+    B22 = [fila[h:] for fila in B[h:]]
+
+    P1 = _strassen_recursivo(_sumar(A11, A22), _sumar(B11, B22))
+    P2 = _strassen_recursivo(_sumar(A21, A22), B11)
+    P3 = _strassen_recursivo(A11, _restar(B12, B22))
+    P4 = _strassen_recursivo(A22, _restar(B21, B11))
+    P5 = _strassen_recursivo(_sumar(A11, A12), B22)
+    P6 = _strassen_recursivo(_restar(A21, A11), _sumar(B11, B12))
+    P7 = _strassen_recursivo(_restar(A12, A22), _sumar(B21, B22))
+
+    C11 = _sumar(_restar(_sumar(P1, P4), P5), P7)
+    C12 = _sumar(P3, P5)
+    C21 = _sumar(P2, P4)
+    C22 = _sumar(_sumar(_restar(P1, P2), P3), P6)
+
+    return [f1 + f2 for f1, f2 in zip(C11, C12)] + [
+        f1 + f2 for f1, f2 in zip(C21, C22)
+    ]
 
 
 def matmul(A: Matriz, B: Matriz | Vector) -> Matriz | Vector:
@@ -351,7 +500,28 @@ def matmul(A: Matriz, B: Matriz | Vector) -> Matriz | Vector:
     Pista: Para matrices, cada elemento resultado[i][j] es el
            producto punto de la fila i de A con la columna j de B
     """
-    raise NotImplementedError("Función no implementada.")
+    columnas_a = len(A[0])
+
+    # Caso Matriz @ Vector: un producto punto por fila, sin resultado 2D
+    if isinstance(B[0], Number):
+        if columnas_a != len(B):
+            raise ValueError(
+                f"Dimensiones incompatibles: {len(A)}x{columnas_a} y vector {len(B)}"
+            )
+        return [float(sum(map(mul, fila, B))) for fila in A]
+
+    if columnas_a != len(B):
+        raise ValueError(
+            f"Dimensiones incompatibles: {len(A)}x{columnas_a} y "
+            f"{len(B)}x{len(B[0])}"
+        )
+
+    # Matrices cuadradas grandes: Strassen hace 7 productos en lugar de 8
+    n = len(A)
+    if n == columnas_a == len(B[0]) and n >= _UMBRAL_STRASSEN:
+        return _strassen(A, B)
+
+    return _matmul_clasico(_a_float(A), _a_float(B))
 
 
 # -------------------------------------------------------------------
@@ -359,6 +529,40 @@ def matmul(A: Matriz, B: Matriz | Vector) -> Matriz | Vector:
 # -------------------------------------------------------------------
 
 
+def _expresion_det(filas: list[int], columnas: list[int]) -> str:
+    """Escribe el determinante por cofactores como una expresión en a{i}{j}."""
+    if len(filas) == 1:
+        return f"a{filas[0]}{columnas[0]}"
+
+    fila, resto = filas[0], filas[1:]
+    expresion = ""
+    for k, columna in enumerate(columnas):
+        menor = _expresion_det(resto, columnas[:k] + columnas[k + 1 :])
+        signo = " - " if k % 2 else (" + " if k else "")
+        expresion += f"{signo}a{fila}{columna} * ({menor})"
+    return expresion
+
+
+def _generar_det_cerrado(n: int):
+    """Genera una función sin bucles ni ramas que calcula el det de n×n."""
+    indices = list(range(n))
+    filas = "".join(
+        "(" + "".join(f"a{i}{j}, " for j in indices) + "), " for i in indices
+    )
+    codigo = (
+        f"def _det{n}(A):\n"
+        f"    {filas} = A\n"
+        f"    return {_expresion_det(indices, indices)}\n"
+    )
+    espacio: dict = {}
+    exec(codigo, espacio)
+    return espacio[f"_det{n}"]
+
+
+# Fórmulas cerradas, generadas al importar, para los tamaños más comunes
+_DET_CERRADO = {n: _generar_det_cerrado(n) for n in range(1, 5)}
+
+
 def det(A: Matriz) -> float:
     """Calcula el determinante de una matriz cuadrada.
 
@@ -367,8 +571,13 @@ def det(A: Matriz) -> float:
     Para matriz 2×2:
         det([[a, b], [c, d]]) = a*d - b*c
 
-    Para matriz 3×3 y mayores:
-        Usa expansión de cofactores (recursivo) o eliminación gaussiana.
+    Para matrices hasta 4×4:
+        Expansión por cofactores desenrollada en una fórmula cerrada,
+        generada una sola vez al importar el módulo.
+
+    Para matrices mayores:
+        Eliminación gaussiana con pivoteo parcial (descomposición LU),
+        O(n³) en lugar del O(n!) de la expansión por cofactores.
 
     Equivalente en NumPy: np.linalg.det(A)
 
@@ -391,6 +600,40 @@ def det(A: Matriz) -> float:
     Pistas:
     - Caso base: matriz 1×1 devuelve el único elemento
     - Caso 2×2: usa la fórmula directa
-    - Caso 3×3+: expansión por primera fila (recursivo)
+    - Caso 3×3 y 4×4: expansión por cofactores
+    - Caso 5×5+: eliminación gaussiana, acumulando el signo de cada intercambio
     """
-    raise NotImplementedError("Función no implementada.")
+    n = len(A)
+    for i, fila in enumerate(A):
+        if len(fila) != n:
+            raise ValueError(
+                f"La matriz debe ser cuadrada: tiene {n} filas pero la fila {i} "
+                f"tiene {len(fila)} elementos"
+            )
+
+    det_cerrado = _DET_CERRADO.get(n)
+    if det_cerrado is not None:
+        return float(det_cerrado(A))
+
+    # Eliminación gaussiana sobre una copia: U queda en U, el det es el
+    # producto de la diagonal con el signo de los intercambios de filas
+    U = [[float(x) for x in fila] for fila in A]
+    signo = 1.0
+    for k in range(n):
+        pivote = max(range(k, n), key=lambda i: abs(U[i][k]))
+        if U[pivote][k] == 0.0:
+            return 0.0
+        if pivote != k:
+            U[k], U[pivote] = U[pivote], U[k]
+            signo = -signo
+
+        fila_k = U[k]
+        diagonal = fila_k[k]
+        for i in range(k + 1, n):
+            fila_i = U[i]
+            factor = fila_i[k] / diagonal
+            if factor:
+                for j in range(k + 1, n):
+                    fila_i[j] -= factor * fila_k[j]
+
+    return signo * prod(U[k][k] for k in range(n))
@@ -1,16 +1,66 @@
 # ===================================================================
 # Sistema de Calificación Modular y Configurable
 # ===================================================================
+import dis
+import sys
 from typing import Callable
 
+# Instrucciones de preámbulo que CPython emite antes del cuerpo de la función
+_PREAMBULO_BYTECODE = {"RESUME", "NOP", "MAKE_CELL", "COPY_FREE_VARS"}
+
+# Instrucciones que cierran una sentencia sin lanzar la excepción
+_FIN_DE_SENTENCIA = {"POP_TOP", "RETURN_VALUE", "RETURN_CONST"}
+
+
+def _es_no_implementada(funcion: Callable) -> bool:
+    """Indica si el cuerpo de una función empieza con raise NotImplementedError.
+
+    Inspecciona el bytecode sin ejecutar la función. Solo mira la primera
+    sentencia del cuerpo: debe cargar NotImplementedError y terminar en un
+    raise. Un raise inalcanzable después de un return, o una sentencia que
+    solo nombra la excepción (x = NotImplementedError), no cuentan.
+    """
+    codigo = getattr(funcion, "__code__", None)
+    if codigo is None:
+        return False
+
+    instrucciones = (
+        instruccion
+        for instruccion in dis.get_instructions(codigo)
+        if instruccion.opname not in _PREAMBULO_BYTECODE
+    )
+    primera = next(instrucciones, None)
+    if (
+        primera is None
+        or primera.opname != "LOAD_GLOBAL"
+        or primera.argval != "NotImplementedError"
+    ):
+        return False
+
+    # Recorrer la primera sentencia hasta la instrucción que la cierra
+    for instruccion in instrucciones:
+        if instruccion.opname == "RAISE_VARARGS":
+            return True
+        nombre = instruccion.opname
+        if nombre in _FIN_DE_SENTENCIA or nombre.startswith("STORE_"):
+            return False
+    return False
+
 
 class GrupoCalificacion:
     """Representa un grupo de pruebas con un valor total configurable.
 
     Este diseño modular permite tener múltiples grupos de pruebas
     (básicas, extras, bonificaciones) cada uno con su propio valor.
+
+    Attributes:
+        verbose_registro: Si False, registrar_prueba no imprime el resultado
+            de cada prueba (útil para lotes grandes; el detalle sigue
+            disponible en mostrar_resumen).
     """
 
+    verbose_registro: bool = True
+
     def __init__(self, nombre: str, valor_maximo: float):
         """Inicializa un grupo de calificación.
 
@@ -20,55 +70,64 @@ class GrupoCalificacion:
         """
         self.nombre = nombre
         self.valor_maximo = valor_maximo
-        self.pruebas_pasadas: list[tuple[str, float]] = []
-        self.pruebas_fallidas: list[tuple[str, float]] = []
-        self.pruebas_no_implementadas: list[tuple[str, float]] = []
+        self.pruebas_pasadas: list[str] = []
+        self.pruebas_fallidas: list[str] = []
+        self.pruebas_no_implementadas: list[str] = []
         self.num_pruebas_registradas = 0
 
-    def registrar_prueba(self, nombre_prueba: str, funcion_prueba: Callable) -> bool:
+    def registrar_prueba(
+        self,
+        nombre_prueba: str,
+        funcion_prueba: Callable,
+        target: Callable | None = None,
+    ) -> bool:
         """Registra y ejecuta una prueba, calculando su valor automáticamente.
 
         Args:
             nombre_prueba: Nombre descriptivo de la prueba
             funcion_prueba: Función que ejecuta la prueba
+            target: Función evaluada por la prueba (opcional). Si su cuerpo
+                empieza con raise NotImplementedError, la prueba se marca como
+                sin implementar sin ejecutarla.
 
         Returns:
             bool: True si la prueba pasó, False en caso contrario
         """
         self.num_pruebas_registradas += 1
+        if target is not None and _es_no_implementada(target):
+            self.pruebas_no_implementadas.append(nombre_prueba)
+            if self.verbose_registro:
+                print(f"✗ {nombre_prueba}: FALTA IMPLEMENTACIÓN")
+            return False
+
         try:
             funcion_prueba()
-            self.pruebas_pasadas.append((nombre_prueba, 0.0))
-            print(f"✓ {nombre_prueba}: PASÓ")
+            self.pruebas_pasadas.append(nombre_prueba)
+            if self.verbose_registro:
+                print(f"✓ {nombre_prueba}: PASÓ")
             return True
         except NotImplementedError:
-            self.pruebas_no_implementadas.append((nombre_prueba, 0.0))
-            print(f"✗ {nombre_prueba}: FALTA IMPLEMENTACIÓN")
+            self.pruebas_no_implementadas.append(nombre_prueba)
+            if self.verbose_registro:
+                print(f"✗ {nombre_prueba}: FALTA IMPLEMENTACIÓN")
             return False
         except AssertionError as e:
-            self.pruebas_fallidas.append((nombre_prueba, 0.0))
-            print(f"✗ {nombre_prueba}: FALLÓ - {str(e)}")
+            self.pruebas_fallidas.append(nombre_prueba)
+            if self.verbose_registro:
+                print(f"✗ {nombre_prueba}: FALLÓ - {str(e)}")
             return False
         except Exception as e:
-            self.pruebas_fallidas.append((nombre_prueba, 0.0))
-            print(f"✗ {nombre_prueba}: ERROR - {type(e).__name__}: {str(e)}")
+            self.pruebas_fallidas.append(nombre_prueba)
+            if self.verbose_registro:
+                print(f"✗ {nombre_prueba}: ERROR - {type(e).__name__}: {str(e)}")
             return False
 
-    def _recalcular_puntos(self):
-        """Recalcula los puntos de todas las pruebas de forma equitativa."""
+    @property
+    def valor_por_prueba(self) -> float:
+        """Valor en % de cada prueba, repartido equitativamente en el grupo."""
         if self.num_pruebas_registradas == 0:
-            return
-
-        valor_por_prueba = self.valor_maximo / self.num_pruebas_registradas
-
-        # Actualizar todos los valores
-        self.pruebas_pasadas = [(n, valor_por_prueba) for n, _ in self.pruebas_pasadas]
-        self.pruebas_fallidas = [
-            (n, valor_por_prueba) for n, _ in self.pruebas_fallidas
-        ]
-        self.pruebas_no_implementadas = [
-            (n, valor_por_prueba) for n, _ in self.pruebas_no_implementadas
-        ]
+            return 0.0
+        return self.valor_maximo / self.num_pruebas_registradas
 
     def calcular_nota(self) -> tuple[float, float]:
         """Calcula la nota obtenida y el máximo posible.
@@ -76,7 +135,7 @@ class GrupoCalificacion:
         Returns:
             tuple[float, float]: (nota_obtenida, valor_maximo)
         """
-        nota_obtenida = sum(puntos for _, puntos in self.pruebas_pasadas)
+        nota_obtenida = len(self.pruebas_pasadas) * self.valor_por_prueba
         return nota_obtenida, self.valor_maximo
 
     def obtener_estadisticas(self) -> dict:
@@ -111,37 +170,45 @@ class GrupoCalificacion:
         Args:
             verbose: Si False, solo muestra estadísticas sin detalles de cada prueba
         """
-        self._recalcular_puntos()
+        sys.stdout.write("\n".join(self._lineas_resumen(verbose)) + "\n")
 
+    def _lineas_resumen(self, verbose: bool) -> list[str]:
+        """Construye las líneas del resumen para escribirlas de una sola vez."""
         stats = self.obtener_estadisticas()
 
-        print(f"\n{'─' * 70}")
-        print(f"📦 {self.nombre}")
-        print(f"{'─' * 70}")
-        print(f"Valor: {stats['nota_obtenida']:.2f}% / {stats['valor_maximo']:.2f}%")
-        print(
+        lineas = [
+            f"\n{'─' * 70}",
+            f"📦 {self.nombre}",
+            f"{'─' * 70}",
+            f"Valor: {stats['nota_obtenida']:.2f}% / {stats['valor_maximo']:.2f}%",
             f"Pruebas: {stats['pasadas']}/{stats['total_pruebas']} pasadas "
-            f"({stats['porcentaje']:.1f}%)"
-        )
+            f"({stats['porcentaje']:.1f}%)",
+        ]
 
         # Solo mostrar detalles si verbose=True
         if not verbose:
-            return
+            return lineas
+
+        puntos = self.valor_por_prueba
 
         if self.pruebas_pasadas:
-            print(f"\n  ✓ Pasadas ({len(self.pruebas_pasadas)}):")
-            for nombre, puntos in self.pruebas_pasadas:
-                print(f"    • {nombre}: +{puntos:.3f}%")
+            lineas.append(f"\n  ✓ Pasadas ({len(self.pruebas_pasadas)}):")
+            for nombre in self.pruebas_pasadas:
+                lineas.append(f"    • {nombre}: +{puntos:.3f}%")
 
         if self.pruebas_fallidas:
-            print(f"\n  ✗ Fallidas ({len(self.pruebas_fallidas)}):")
-            for nombre, puntos in self.pruebas_fallidas:
-                print(f"    • {nombre}: 0/{puntos:.3f}%")
+            lineas.append(f"\n  ✗ Fallidas ({len(self.pruebas_fallidas)}):")
+            for nombre in self.pruebas_fallidas:
+                lineas.append(f"    • {nombre}: 0/{puntos:.3f}%")
 
         if self.pruebas_no_implementadas:
-            print(f"\n  ⚠ Sin Implementar ({len(self.pruebas_no_implementadas)}):")
-            for nombre, puntos in self.pruebas_no_implementadas:
-                print(f"    • {nombre}: 0/{puntos:.3f}%")
+            lineas.append(
+                f"\n  ⚠ Sin Implementar ({len(self.pruebas_no_implementadas)}):"
+            )
+            for nombre in self.pruebas_no_implementadas:
+                lineas.append(f"    • {nombre}: 0/{puntos:.3f}%")
+
+        return lineas
 
 
 class SistemaCalificacion:
@@ -184,8 +251,12 @@ class SistemaCalificacion:
         Returns:
             tuple[float, float]: (nota_obtenida_total, valor_maximo_total)
         """
-        nota_total = sum(grupo.calcular_nota()[0] for grupo in self.grupos)
-        valor_total = sum(grupo.calcular_nota()[1] for grupo in self.grupos)
+        nota_total = 0.0
+        valor_total = 0.0
+        for grupo in self.grupos:
+            nota, valor = grupo.calcular_nota()
+            nota_total += nota
+            valor_total += valor
         return nota_total, valor_total
 
     def mostrar_resumen_completo(self, verbose: bool = False):
@@ -195,60 +266,72 @@ class SistemaCalificacion:
             verbose: Si True, muestra el detalle de todas las pruebas.
                     Si False (default), solo muestra estadísticas resumidas.
         """
-        print("\n" + "=" * 70)
-        print("📊 RESUMEN DE CALIFICACIÓN COMPLETO")
-        print("=" * 70)
+        lineas = [
+            "\n" + "=" * 70,
+            "📊 RESUMEN DE CALIFICACIÓN COMPLETO",
+            "=" * 70,
+        ]
 
         for grupo in self.grupos:
-            grupo.mostrar_resumen(verbose=verbose)
+            lineas.extend(grupo._lineas_resumen(verbose))
 
         nota_total, valor_total = self.calcular_nota_total()
 
-        print("\n" + "=" * 70)
-        print(f"🎓 NOTA FINAL: {nota_total:.2f}% / {valor_total:.2f}%")
+        lineas.append("\n" + "=" * 70)
+        lineas.append(f"🎓 NOTA FINAL: {nota_total:.2f}% / {valor_total:.2f}%")
 
         if valor_total > 0:
             porcentaje_global = (nota_total / valor_total) * 100
-            print(f"📈 Porcentaje de Completitud Global: {porcentaje_global:.1f}%")
+            lineas.append(
+                f"📈 Porcentaje de Completitud Global: {porcentaje_global:.1f}%"
+            )
 
             # Mensaje motivacional
             if porcentaje_global == 100:
-                print("🌟 ¡PERFECTO! Todas las funciones implementadas correctamente.")
+                lineas.append(
+                    "🌟 ¡PERFECTO! Todas las funciones implementadas correctamente."
+                )
             elif porcentaje_global >= 90:
-                print("🎉 ¡EXCELENTE! Casi perfecto.")
+                lineas.append("🎉 ¡EXCELENTE! Casi perfecto.")
             elif porcentaje_global >= 75:
-                print("👏 ¡MUY BIEN! Buen trabajo.")
+                lineas.append("👏 ¡MUY BIEN! Buen trabajo.")
             elif porcentaje_global >= 50:
-                print("👍 Buen progreso. Sigue adelante.")
+                lineas.append("👍 Buen progreso. Sigue adelante.")
             else:
-                print("💪 Continúa trabajando. ¡Tú puedes!")
+                lineas.append("💪 Continúa trabajando. ¡Tú puedes!")
 
-        print("=" * 70)
+        lineas.append("=" * 70)
+        sys.stdout.write("\n".join(lineas) + "\n")
 
     def mostrar_resumen_por_seccion(self):
         """Muestra un resumen compacto agrupado por secciones (Parte 1, Parte 2, etc.)"""
-        print("\n" + "=" * 70)
-        print("📊 RESUMEN POR SECCIÓN")
-        print("=" * 70)
+        lineas = [
+            "\n" + "=" * 70,
+            "📊 RESUMEN POR SECCIÓN",
+            "=" * 70,
+        ]
 
-        # Primero recalcular puntos de TODOS los grupos
+        # Agrupar por "Parte" en una sola pasada
+        parte1: list[GrupoCalificacion] = []
+        parte2: list[GrupoCalificacion] = []
         for grupo in self.grupos:
-            grupo._recalcular_puntos()
-
-        # Agrupar por "Parte"
-        parte1 = [g for g in self.grupos if not g.nombre.startswith("Parte 2")]
-        parte2 = [g for g in self.grupos if g.nombre.startswith("Parte 2")]
+            (parte2 if grupo.nombre.startswith("Parte 2") else parte1).append(grupo)
 
         def mostrar_seccion(nombre: str, grupos: list[GrupoCalificacion]):
             if not grupos:
                 return
 
-            nota_seccion = sum(g.calcular_nota()[0] for g in grupos)
-            valor_seccion = sum(g.calcular_nota()[1] for g in grupos)
-            total_pruebas = sum(
-                g.obtener_estadisticas()["total_pruebas"] for g in grupos
-            )
-            pruebas_pasadas = sum(g.obtener_estadisticas()["pasadas"] for g in grupos)
+            # Una sola consulta de estadísticas por grupo
+            estadisticas = [g.obtener_estadisticas() for g in grupos]
+            nota_seccion = 0.0
+            valor_seccion = 0.0
+            total_pruebas = 0
+            pruebas_pasadas = 0
+            for stats in estadisticas:
+                nota_seccion += stats["nota_obtenida"]
+                valor_seccion += stats["valor_maximo"]
+                total_pruebas += stats["total_pruebas"]
+                pruebas_pasadas += stats["pasadas"]
 
             porcentaje = (
                 (nota_seccion / valor_seccion * 100) if valor_seccion > 0 else 0
@@ -262,13 +345,14 @@ class SistemaCalificacion:
             else:
                 simbolo = "❌"
 
-            print(f"\n{simbolo} {nombre}")
-            print(f"   Nota: {nota_seccion:.2f}% / {valor_seccion:.2f}%")
-            print(f"   Pruebas: {pruebas_pasadas}/{total_pruebas} ({porcentaje:.1f}%)")
+            lineas.append(f"\n{simbolo} {nombre}")
+            lineas.append(f"   Nota: {nota_seccion:.2f}% / {valor_seccion:.2f}%")
+            lineas.append(
+                f"   Pruebas: {pruebas_pasadas}/{total_pruebas} ({porcentaje:.1f}%)"
+            )
 
-            for grupo in grupos:
-                stats = grupo.obtener_estadisticas()
-                print(
+            for grupo, stats in zip(grupos, estadisticas):
+                lineas.append(
                     f"      • {grupo.nombre}: {stats['nota_obtenida']:.2f}% / {stats['valor_maximo']:.2f}%"
                 )
 
@@ -279,8 +363,9 @@ class SistemaCalificacion:
         nota_total, valor_total = self.calcular_nota_total()
         porcentaje_global = (nota_total / valor_total * 100) if valor_total > 0 else 0
 
-        print("\n" + "─" * 70)
-        print(
+        lineas.append("\n" + "─" * 70)
+        lineas.append(
             f"🎓 CALIFICACIÓN TOTAL: {nota_total:.2f}% / {valor_total:.2f}% ({porcentaje_global:.1f}%)"
         )
-        print("=" * 70)
+        lineas.append("=" * 70)
+        sys.stdout.write("\n".join(lineas) + "\n")